@@ -0,0 +1,101 @@
+"""
+_checks.py
+
+Per-schema checks shared by ``validate_schemas``, ``audit_schema_defaults``
+and ``validate_all``. Each check appends human-readable problems to a list
+supplied by the caller, so the CLIs only decide what to run and how to
+report it.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import yaml
+
+try:
+    from ._fastjson import JSONDecodeError, load_path
+    from ._manifest import ManifestEntry, load_manifest, manifest_entries
+except ImportError:  # executed as a plain script
+    from _fastjson import JSONDecodeError, load_path
+    from _manifest import ManifestEntry, load_manifest, manifest_entries
+
+# We are under schemas/tools/, so the repo root is two levels up.
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MANIFEST_PATH = REPO_ROOT / "schemas" / "manifest.yml"
+
+
+class SchemaValidationError(RuntimeError):
+    """Raised when the validator detects any mismatch."""
+
+
+def load_entries() -> Tuple[ManifestEntry, ...]:
+    """Load schemas/manifest.yml and flatten it into entries."""
+    if not MANIFEST_PATH.exists():
+        raise SchemaValidationError("schemas/manifest.yml not found")
+    try:
+        manifest = load_manifest(MANIFEST_PATH)
+    except yaml.YAMLError as exc:  # pragma: no cover
+        raise SchemaValidationError(f"manifest.yml is not valid YAML: {exc}") from exc
+    return manifest_entries(manifest)
+
+
+def load_entry(entry: ManifestEntry, errors: List[str]) -> Optional[Any]:
+    """
+    Return the parsed Avro document for *entry*, or record why it could not
+    be read in *errors* and return None.
+    """
+    avsc_path = REPO_ROOT / entry.file
+    try:
+        return load_path(avsc_path)
+    except FileNotFoundError:
+        errors.append(f"{entry.domain}.{entry.name}: file missing at {avsc_path}")
+    except JSONDecodeError as exc:
+        errors.append(f"{avsc_path}: invalid JSON ({exc})")
+    return None
+
+
+def check_version(entry: ManifestEntry, schema_json: Any, errors: List[str]) -> None:
+    """Compare the embedded schema version with the manifest entry."""
+    # Allow files that contain a list of definitions
+    top = schema_json[0] if isinstance(schema_json, list) else schema_json
+    embedded_version = top.get("version")
+    if embedded_version != entry.version:
+        errors.append(
+            f"{entry.domain}.{entry.name}: version mismatch "
+            f"(manifest={entry.version}, file={embedded_version})"
+        )
+
+
+def is_nullable(avro_type) -> bool:
+    # `"null" in avro_type` settles the common ["null", ...] union with a
+    # C-level scan; the generator only runs for {"type": "null"} branches.
+    return isinstance(avro_type, list) and (
+        "null" in avro_type
+        or any(isinstance(t, dict) and t.get("type") == "null" for t in avro_type)
+    )
+
+
+def check_defaults(schema_json: Any, problems: List[str]) -> None:
+    """Audit the null defaults of an already-parsed schema document."""
+    # Schema files may contain a list of definitions
+    records = schema_json if isinstance(schema_json, list) else [schema_json]
+
+    for rec in records:
+        if rec.get("type") != "record":
+            continue
+
+        rec_fullname = f"{rec.get('namespace', '').strip('.')}.{rec['name']}"
+        for fld in rec.get("fields", []):
+            nullable = is_nullable(fld["type"])
+            has_null_default = "default" in fld and fld["default"] is None
+
+            if nullable and not has_null_default:
+                problems.append(
+                    f"{rec_fullname}.{fld['name']} – nullable but missing default null"
+                )
+            if not nullable and has_null_default:
+                problems.append(
+                    f"{rec_fullname}.{fld['name']} – non-nullable but default null"
+                )
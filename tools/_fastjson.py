@@ -0,0 +1,86 @@
+"""
+_fastjson.py
+
+JSON shim for the schema tools. Decodes with ``orjson`` when installed,
+then ``simdjson`` (pysimdjson), and finally the stdlib ``json`` module.
+All three accept UTF-8 bytes directly, so files are read in binary mode
+and never decoded to ``str`` first.
+
+Files of ``MMAP_THRESHOLD`` bytes or more are memory-mapped and handed to
+``orjson`` as a ``memoryview``, skipping the copy into a ``bytes`` object.
+The other backends need real ``bytes`` and always read normally.
+
+``JSONDecodeError`` is the exception raised by the selected backend on
+malformed input. ``dumps`` writes 2-space indented UTF-8 with a trailing
+newline, using ``orjson`` when available and stdlib ``json`` otherwise.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+MMAP_THRESHOLD = 64 * 1024
+
+try:
+    import orjson
+
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+    BACKEND = "orjson"
+    _PARSES_BUFFERS = True
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+
+except ImportError:  # pragma: no cover - depends on installed extras
+    import json
+
+    _PARSES_BUFFERS = False
+
+    def dumps(obj: Any) -> bytes:
+        # ensure_ascii=False matches orjson, which never escapes non-ASCII
+        return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode(
+            "utf-8"
+        )
+
+    try:
+        import simdjson
+
+        loads = simdjson.loads
+        JSONDecodeError = ValueError
+        BACKEND = "simdjson"
+    except ImportError:
+        loads = json.loads
+        JSONDecodeError = json.JSONDecodeError
+        BACKEND = "json"
+
+
+@contextmanager
+def read_buffer(path: Union[str, Path]) -> Iterator[Union[bytes, memoryview]]:
+    """
+    Yield the raw contents of *path* in a form ``loads`` accepts. Large files
+    are mapped rather than read when the backend supports it; the buffer is
+    only valid inside the ``with`` block.
+    """
+    with open(path, "rb") as f:
+        if _PARSES_BUFFERS and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    yield view
+                finally:
+                    view.release()
+        else:
+            yield f.read()
+
+
+def load_path(path: Union[str, Path]) -> Any:
+    """Read and decode the JSON document at *path*."""
+    with read_buffer(path) as raw:
+        return loads(raw)
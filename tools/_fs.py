@@ -0,0 +1,34 @@
+"""
+_fs.py
+
+Filesystem helpers shared by the schema tools.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import FrozenSet, Iterator
+
+# Directories under the schemas root that never contain schema files.
+SKIP_DIRS: FrozenSet[str] = frozenset({"tools", "__pycache__"})
+
+
+def walk_avsc(root: str) -> Iterator[str]:
+    """
+    Yield the path of every ``*.avsc`` file beneath *root* as a plain string.
+
+    Uses ``os.scandir`` so file-type checks come from the cached directory
+    entry instead of an extra ``stat`` per path. Ordering matches
+    ``Path.rglob``: a directory's files first, then its subdirectories.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".avsc"):
+                    yield entry.path
+        stack.extend(reversed(subdirs))
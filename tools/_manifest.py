@@ -0,0 +1,122 @@
+"""
+_manifest.py
+
+Manifest loading shared by the schema tools.
+
+``normalize_manifest --write`` emits a compiled ``manifest.json`` next to
+``manifest.yml``, stamped with a digest of the YAML bytes it was built from.
+Readers use the JSON form only while that digest matches the current YAML
+and parse the YAML otherwise, so a hand edit to ``manifest.yml`` is always
+picked up regardless of file timestamps.
+
+Across separate tool runs (e.g. back to back in CI) the saving comes from
+the compiled JSON alone; each call parses afresh.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple
+
+try:
+    from ._fastjson import JSONDecodeError, dumps, load_path
+    from ._yaml import safe_load
+except ImportError:  # executed as a plain script
+    from _fastjson import JSONDecodeError, dumps, load_path
+    from _yaml import safe_load
+
+
+class ManifestEntry(NamedTuple):
+    """One ``schemas.<domain>[]`` entry, reduced to the fields tools check."""
+
+    domain: str
+    name: str
+    file: str
+    version: Optional[str]
+    table_name: Optional[str] = None
+
+
+def manifest_entries(manifest: Dict) -> Tuple[ManifestEntry, ...]:
+    """Flatten the grouped manifest into a tuple of entries, in file order."""
+    return tuple(
+        ManifestEntry(
+            domain, e.get("name"), e["file"], e.get("version"), e.get("table_name")
+        )
+        for domain, entries in manifest.get("schemas", {}).items()
+        for e in entries
+    )
+
+
+def group_entries(groups: Dict, strict: bool = False) -> Iterator[ManifestEntry]:
+    """
+    Yield one entry per mapping in the ``schemas`` *groups*, in file order.
+    Fields absent from an entry are None, and empty groups yield nothing.
+
+    Other malformed groups and entries are skipped, or raise ValueError when
+    *strict* is set; strict mode also requires "file" to be a string and
+    "version" a scalar whenever they are present.
+    """
+    for domain, entries in groups.items():
+        if entries is None:
+            continue
+        if not isinstance(entries, list):
+            if strict:
+                raise ValueError(f"schemas.{domain} is not a list")
+            continue
+        for e in entries:
+            if not isinstance(e, dict):
+                if strict:
+                    raise ValueError(f"schemas.{domain} has a non-mapping entry")
+                continue
+            entry = ManifestEntry(
+                domain,
+                e.get("name"),
+                e.get("file"),
+                e.get("version"),
+                e.get("table_name"),
+            )
+            if strict:
+                if entry.file is not None and not isinstance(entry.file, str):
+                    raise ValueError(f"schemas.{domain}: 'file' is not a string")
+                if entry.version is not None and not isinstance(
+                    entry.version, (str, int, float)
+                ):
+                    raise ValueError(f"schemas.{domain}: 'version' is not a scalar")
+            yield entry
+
+
+def compiled_path(manifest_path: Path) -> Path:
+    """Location of the compiled JSON form of *manifest_path*."""
+    return manifest_path.with_suffix(".json")
+
+
+def _source_digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def load_manifest(manifest_path: Path) -> Any:
+    """
+    Parse *manifest_path*, preferring its compiled JSON sibling when that was
+    built from the current YAML bytes. YAML errors propagate unchanged.
+    """
+    raw = manifest_path.read_bytes()
+    try:
+        compiled = load_path(compiled_path(manifest_path))
+    except (OSError, JSONDecodeError):
+        # missing, unreadable or corrupt compiled form: use the YAML
+        compiled = None
+    if isinstance(compiled, dict) and compiled.get("source") == _source_digest(raw):
+        return compiled["manifest"]
+    return safe_load(raw)
+
+
+def write_compiled(manifest_path: Path, manifest: Any) -> None:
+    """
+    Write *manifest* as the compiled JSON sibling of *manifest_path*. The YAML
+    on disk must already hold *manifest*; its digest is recorded alongside.
+    """
+    source = _source_digest(manifest_path.read_bytes())
+    compiled_path(manifest_path).write_bytes(
+        dumps({"source": source, "manifest": manifest})
+    )
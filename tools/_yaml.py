@@ -0,0 +1,26 @@
+"""
+_yaml.py
+
+Thin wrappers around PyYAML that prefer the libyaml-backed C loader/dumper
+when PyYAML was built with it, falling back to the pure-Python classes
+otherwise. Output is identical either way; only parse/emit speed differs.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any, Optional, Union
+
+import yaml
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def safe_load(stream: Union[str, bytes, IO[Any]]) -> Any:
+    """Drop-in replacement for ``yaml.safe_load``."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: Optional[IO[Any]] = None, **kwargs: Any) -> Any:
+    """Drop-in replacement for ``yaml.safe_dump``."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
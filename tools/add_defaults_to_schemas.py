@@ -11,10 +11,20 @@ Usage:
 """
 from __future__ import annotations
 
-import json
+import os
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from types import MappingProxyType
+from typing import Any, Dict, Final, List, Mapping, Union
+
+try:
+    from ._fastjson import dumps, load_path
+    from ._fs import walk_avsc
+except ImportError:  # executed as a plain script
+    from _fastjson import dumps, load_path
+    from _fs import walk_avsc
 
 # We are now under schemas/tools/, so SCHEMA_ROOT is one level up.
 SCHEMA_ROOT = Path(__file__).resolve().parents[1]
@@ -22,6 +32,20 @@ SCHEMA_ROOT = Path(__file__).resolve().parents[1]
 
 Primitive = Union[str, int, float, bool, None, Dict[str, Any], List[Any]]
 
+# Defaults for Avro primitive type names. Built once at import rather than
+# on every field visited.
+_PRIMITIVE_DEFAULTS: Final[Mapping[str, Primitive]] = MappingProxyType(
+    {
+        "string": "",
+        "bytes": "",
+        "boolean": False,
+        "int": 0,
+        "long": 0,
+        "float": 0.0,
+        "double": 0.0,
+    }
+)
+
 
 def _default_for_type(avro_type: Primitive) -> Primitive:
     """
@@ -33,15 +57,7 @@ def _default_for_type(avro_type: Primitive) -> Primitive:
     """
     # Primitive type expressed as a string
     if isinstance(avro_type, str):
-        return {
-            "string": "",
-            "bytes": "",
-            "boolean": False,
-            "int": 0,
-            "long": 0,
-            "float": 0.0,
-            "double": 0.0,
-        }.get(avro_type, None)
+        return _PRIMITIVE_DEFAULTS.get(avro_type)
 
     # Union of types
     if isinstance(avro_type, list):
@@ -77,52 +93,57 @@ def _default_for_type(avro_type: Primitive) -> Primitive:
 
 def _inject_defaults(schema: Dict[str, Any]) -> bool:
     """
-    Recursively walk `schema` and inject defaults where missing.
+    Walk `schema` and every nested record and inject defaults where missing.
+
+    Uses an explicit work stack rather than recursion, so deeply nested
+    schemas cost no extra Python frames and cannot hit the recursion limit.
 
     Returns True if the schema dict was modified.
     """
     modified = False
-    if "fields" not in schema:
-        return modified
-
-    for field in schema["fields"]:
-        if "default" not in field:
-            default_value = _default_for_type(field["type"])
-            if default_value is not None:
-                field["default"] = default_value
-                modified = True
-
-        # Recurse into nested records / arrays
-        field_type = field["type"]
-        # List ⇒ union
-        if isinstance(field_type, list):
-            for branch in field_type:
-                if isinstance(branch, dict):
-                    modified |= _inject_defaults(branch)
-        # Dict ⇒ complex type
-        if isinstance(field_type, dict):
-            t = field_type.get("type")
-            if t == "array":
-                items = field_type.get("items")
-                if isinstance(items, dict):
-                    modified |= _inject_defaults(items)
-            elif t == "map":
-                values = field_type.get("values")
-                if isinstance(values, dict):
-                    modified |= _inject_defaults(values)
-            elif t == "record":
-                modified |= _inject_defaults(field_type)
-            # enum / fixed do not contain fields
+    stack = deque([schema])
+    while stack:
+        node = stack.pop()
+        if "fields" not in node:
+            continue
+
+        for field in node["fields"]:
+            if "default" not in field:
+                default_value = _default_for_type(field["type"])
+                if default_value is not None:
+                    field["default"] = default_value
+                    modified = True
+
+            # Queue nested records / arrays
+            field_type = field["type"]
+            # List ⇒ union
+            if isinstance(field_type, list):
+                for branch in field_type:
+                    if isinstance(branch, dict):
+                        stack.append(branch)
+            # Dict ⇒ complex type
+            if isinstance(field_type, dict):
+                t = field_type.get("type")
+                if t == "array":
+                    items = field_type.get("items")
+                    if isinstance(items, dict):
+                        stack.append(items)
+                elif t == "map":
+                    values = field_type.get("values")
+                    if isinstance(values, dict):
+                        stack.append(values)
+                elif t == "record":
+                    stack.append(field_type)
+                # enum / fixed do not contain fields
 
     return modified
 
 
 def process_file(path: Path) -> bool:
-    text = path.read_text()
-    data = json.loads(text)
+    data = load_path(path)
     changed = _inject_defaults(data)
     if changed:
-        path.write_text(json.dumps(data, indent=2, sort_keys=False) + "\n")
+        path.write_bytes(dumps(data))
     return changed
 
 
@@ -131,14 +152,18 @@ def main() -> None:
         print(f"Schema directory {SCHEMA_ROOT} not found", file=sys.stderr)
         sys.exit(1)
 
-    avsc_files = list(SCHEMA_ROOT.rglob("*.avsc"))
+    avsc_files = [Path(p) for p in walk_avsc(str(SCHEMA_ROOT))]
     if not avsc_files:
         print("No .avsc files found.", file=sys.stderr)
         sys.exit(1)
 
+    # Each file is read, patched and written independently by its worker.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        changed = list(ex.map(process_file, avsc_files))
+
     total_changed = 0
-    for avsc in avsc_files:
-        if process_file(avsc):
+    for avsc, was_changed in zip(avsc_files, changed):
+        if was_changed:
             total_changed += 1
             print(f"✔  Updated defaults in {avsc.relative_to(Path.cwd())}")
 
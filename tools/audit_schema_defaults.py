@@ -15,81 +15,39 @@ Exit status:
 
 from __future__ import annotations
 
-import json
+import os
 import sys
-from pathlib import Path
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
-import yaml
+try:
+    from ._checks import SchemaValidationError, check_defaults, load_entries, load_entry
+    from ._manifest import ManifestEntry
+except ImportError:  # executed as a plain script
+    from _checks import SchemaValidationError, check_defaults, load_entries, load_entry
+    from _manifest import ManifestEntry
 
-# We are now under schemas/tools/, so the repo root is two levels up.
-REPO_ROOT = Path(__file__).resolve().parents[2]
-MANIFEST = REPO_ROOT / "schemas" / "manifest.yml"
 
-
-def _load_manifest() -> Dict:
-    if not MANIFEST.exists():
-        sys.stderr.write(f"Manifest not found at {MANIFEST}\n")
-        sys.exit(1)
-    return yaml.safe_load(MANIFEST.read_text())
-
-
-def _iter_schema_files(manifest: Dict) -> List[Path]:
-    files: List[Path] = []
-    for domain, entries in manifest.get("schemas", {}).items():
-        for ent in entries:
-            files.append(REPO_ROOT / ent["file"])
-    return files
-
-
-def _is_nullable(avro_type) -> bool:
-    if isinstance(avro_type, list):
-        return any(
-            t == "null" or (isinstance(t, dict) and t.get("type") == "null")
-            for t in avro_type
-        )
-    return False
-
-
-def _check_schema(path: Path, problems: List[str]) -> None:
-    try:
-        text = path.read_text()
-        schema_json = json.loads(text)
-    except Exception as exc:  # pragma: no cover
-        problems.append(f"{path}: invalid JSON ({exc})")
-        return
-
-    # Schema files may contain a list of definitions
-    records = schema_json if isinstance(schema_json, list) else [schema_json]
-
-    for rec in records:
-        if rec.get("type") != "record":
-            continue
-
-        rec_fullname = f"{rec.get('namespace', '').strip('.')}.{rec['name']}"
-        for fld in rec.get("fields", []):
-            nullable = _is_nullable(fld["type"])
-            has_null_default = "default" in fld and fld["default"] is None
-
-            if nullable and not has_null_default:
-                problems.append(
-                    f"{rec_fullname}.{fld['name']} – nullable but missing default null"
-                )
-            if not nullable and has_null_default:
-                problems.append(
-                    f"{rec_fullname}.{fld['name']} – non-nullable but default null"
-                )
+def _audit_entry(entry: ManifestEntry) -> List[str]:
+    problems: List[str] = []
+    schema_json = load_entry(entry, problems)
+    if schema_json is not None:
+        check_defaults(schema_json, problems)
+    return problems
 
 
 def main() -> None:
-    manifest = _load_manifest()
+    try:
+        entries = load_entries()
+    except SchemaValidationError as exc:
+        sys.stderr.write(f"{exc}\n")
+        sys.exit(1)
     problems: List[str] = []
 
-    for schema_file in _iter_schema_files(manifest):
-        if not schema_file.exists():
-            problems.append(f"{schema_file} – referenced in manifest but missing")
-            continue
-        _check_schema(schema_file, problems)
+    # Audit files concurrently; results are merged in manifest order.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for entry_problems in ex.map(_audit_entry, entries):
+            problems.extend(entry_problems)
 
     if problems:
         print("❌ Schema default audit failed:")
@@ -8,6 +8,9 @@ Scans schemas/**/*.avsc and ensures schemas/manifest.yml:
  - provides aliases for both unsuffixed and Schema-suffixed names
  - preserves existing description/compatibility/version when present
 
+With --write, a compiled manifest.json is also written next to manifest.yml;
+validators load it instead of re-parsing the YAML while it matches the YAML.
+
 Usage:
   Dry run (report only):
     python -m schemas.tools.normalize_manifest
@@ -17,12 +20,23 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import yaml
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    from ._fastjson import load_path
+    from ._fs import walk_avsc
+    from ._manifest import write_compiled
+    from ._yaml import safe_dump, safe_load
+except ImportError:  # executed as a plain script
+    from _fastjson import load_path
+    from _fs import walk_avsc
+    from _manifest import write_compiled
+    from _yaml import safe_dump, safe_load
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 SCHEMAS_ROOT = REPO_ROOT / "schemas"
@@ -42,7 +56,7 @@ def _read_manifest(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {"version": 1, "schemas": {}}
     with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = safe_load(f) or {}
     if "schemas" not in data:
         data["schemas"] = {}
     # ensure naming policy exists
@@ -56,14 +70,11 @@ def _read_manifest(path: Path) -> Dict[str, Any]:
 
 
 def _iter_avsc_files(root: Path) -> List[Path]:
-    skip = {"tools", "__pycache__"}
-    out: List[Path] = []
-    for child in root.iterdir():
-        if not child.is_dir() or child.name in skip:
-            continue
-        for p in child.rglob("*.avsc"):
-            out.append(p)
-    return out
+    root_str = str(root)
+    # Only files inside a group folder count; the root itself holds none.
+    return [
+        Path(p) for p in walk_avsc(root_str) if os.path.dirname(p) != root_str
+    ]
 
 
 def _pick_primary_record(schema_json: Any, file_path: Path) -> Optional[Dict[str, Any]]:
@@ -92,32 +103,36 @@ def _pick_primary_record(schema_json: Any, file_path: Path) -> Optional[Dict[str
     return preferred[0] if preferred else candidates[0]
 
 
+def _parse_one(avsc_path: Path) -> Optional[AvroRecordInfo]:
+    try:
+        data = load_path(avsc_path)
+    except Exception:
+        # skip invalid JSON; separate validators will catch this
+        return None
+
+    rec = _pick_primary_record(data, avsc_path)
+    if not rec or rec.get("type") != "record":
+        return None
+
+    group = avsc_path.relative_to(SCHEMAS_ROOT).parts[0]
+    file_rel = str(avsc_path.relative_to(REPO_ROOT)).replace("\\", "/")
+    name = rec.get("name")
+    namespace = rec.get("namespace", "")
+    doc = rec.get("doc")
+    return AvroRecordInfo(
+        group=group, file_rel=file_rel, name=name, namespace=namespace, doc=doc
+    )
+
+
 def _scan_avro() -> List[AvroRecordInfo]:
-    records: List[AvroRecordInfo] = []
-    for avsc_path in _iter_avsc_files(SCHEMAS_ROOT):
-        try:
-            data = json.loads(avsc_path.read_text(encoding="utf-8"))
-        except Exception:
-            # skip invalid JSON; separate validators will catch this
-            continue
-
-        rec = _pick_primary_record(data, avsc_path)
-        if not rec or rec.get("type") != "record":
-            continue
-
-        group = avsc_path.relative_to(SCHEMAS_ROOT).parts[0]
-        file_rel = str(avsc_path.relative_to(REPO_ROOT)).replace("\\", "/")
-        name = rec.get("name")
-        namespace = rec.get("namespace", "")
-        doc = rec.get("doc")
-        records.append(
-            AvroRecordInfo(
-                group=group, file_rel=file_rel, name=name, namespace=namespace, doc=doc
-            )
-        )
-    return records
+    paths = _iter_avsc_files(SCHEMAS_ROOT)
+    # Files are independent; overlap the reads and parses across threads.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = list(ex.map(_parse_one, paths))
+    return [r for r in results if r is not None]
 
 
+@lru_cache(maxsize=4096)
 def _canonicalize_name(name: str, canonical_style: str = "unsuffixed") -> str:
     if canonical_style == "unsuffixed":
         return name[:-6] if name.endswith("Schema") else name
@@ -125,6 +140,7 @@ def _canonicalize_name(name: str, canonical_style: str = "unsuffixed") -> str:
     return name
 
 
+@lru_cache(maxsize=4096)
 def _derive_table_name(name: str, canonical_style: str = "unsuffixed") -> str:
     """
     Derive lowercase table name from schema name.
@@ -140,12 +156,14 @@ def _derive_table_name(name: str, canonical_style: str = "unsuffixed") -> str:
     return base.lower()
 
 
-def _aliases_for(name: str, canonical_style: str = "unsuffixed") -> List[str]:
+@lru_cache(maxsize=4096)
+def _aliases_for(name: str, canonical_style: str = "unsuffixed") -> Tuple[str, ...]:
+    # Memoized, so hand back an immutable tuple; callers copy into a list.
     base = _canonicalize_name(name, canonical_style)
     alts = {base, f"{base}Schema", name}
     # ensure deterministic order with canonical first
     rest = sorted(x for x in alts if x != base)
-    return [base] + rest
+    return (base, *rest)
 
 
 def _entry_key(entry: Dict[str, Any]) -> Tuple[str, str]:
@@ -174,7 +192,7 @@ def _merge_manifest(
         existing_entry = existing_by_group.get(info.group, {}).get(entry_key)
 
         canonical_name = _canonicalize_name(info.name, canonical_style)
-        alias_list = _aliases_for(info.name, canonical_style)
+        alias_list = list(_aliases_for(info.name, canonical_style))
         table_name = _derive_table_name(info.name, canonical_style)
 
         if existing_entry:
@@ -214,18 +232,20 @@ def _merge_manifest(
         group_entries.append(merged)
 
     # Include any existing entries that reference files no longer present (so we don't drop them silently)
+    present_keys: Dict[str, Set[Tuple[str, str]]] = {
+        g: {_entry_key(e) for e in es} for g, es in out_schemas.items()
+    }
     for group, entries in (existing.get("schemas") or {}).items():
         for e in entries or []:
             key = _entry_key(e)
             # If not already added from scans, keep as-is
-            if group not in out_schemas or all(
-                _entry_key(x) != key for x in out_schemas[group]
-            ):
+            if key not in present_keys.get(group, ()):
+                present_keys.setdefault(group, set()).add(key)
                 out = dict(e)
                 # Normalize aliases, name, and table_name if missing
                 if "name" in out:
                     out.setdefault(
-                        "aliases", _aliases_for(out["name"], canonical_style)
+                        "aliases", list(_aliases_for(out["name"], canonical_style))
                     )
                     out["name"] = _canonicalize_name(out["name"], canonical_style)
                     # Add table_name if missing
@@ -255,6 +275,26 @@ def _merge_manifest(
     return new_manifest
 
 
+def _same_document(a: Any, b: Any) -> bool:
+    """
+    True if *a* and *b* would serialize to the same YAML. Unlike ``==`` this
+    also compares mapping key order, which ``sort_keys=False`` preserves.
+    """
+    if isinstance(a, dict):
+        return (
+            isinstance(b, dict)
+            and list(a) == list(b)
+            and all(_same_document(a[k], b[k]) for k in a)
+        )
+    if isinstance(a, list):
+        return (
+            isinstance(b, list)
+            and len(a) == len(b)
+            and all(map(_same_document, a, b))
+        )
+    return type(a) is type(b) and a == b
+
+
 def main() -> None:
     global SCHEMAS_ROOT
 
@@ -283,18 +323,20 @@ def main() -> None:
     new_manifest = _merge_manifest(existing, scans)
 
     # Simple change detection
-    existing_yaml = yaml.safe_dump(
-        existing, sort_keys=False, allow_unicode=True
-    ).strip()
-    new_yaml = yaml.safe_dump(new_manifest, sort_keys=False, allow_unicode=True).strip()
-
-    if existing_yaml == new_yaml:
+    if _same_document(existing, new_manifest):
         print("✓ Manifest is already normalized. No changes needed.")
+        if args.write:
+            write_compiled(manifest_path, new_manifest)
         return
 
     if args.write:
-        yaml_text = yaml.safe_dump(new_manifest, sort_keys=False, allow_unicode=True)
-        manifest_path.write_text(yaml_text, encoding="utf-8")
+        # Emit the whole document before opening the file, so a failure
+        # during the dump cannot leave manifest.yml truncated.
+        text = safe_dump(new_manifest, sort_keys=False, allow_unicode=True)
+        manifest_path.write_text(text, encoding="utf-8")
+        # Compiled form for the validators; written after the YAML so it
+        # records the digest of the bytes just written.
+        write_compiled(manifest_path, new_manifest)
         print(f"✓ Wrote normalized manifest to {manifest_path}")
     else:
         print("Manifest would be updated. Run with --write to apply changes.")
@@ -1,54 +1,61 @@
 #!/usr/bin/env python3
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Tuple, Set
 
-import yaml
+try:
+    from . import _manifest
+    from ._fs import walk_avsc
+except ImportError:  # executed as a plain script
+    import _manifest
+    from _fs import walk_avsc
 
 
 def load_manifest(manifest_path: Path) -> Dict[str, List[Dict[str, str]]]:
-    with manifest_path.open("r", encoding="utf-8") as f:
-        content = yaml.safe_load(f)
+    content = _manifest.load_manifest(manifest_path)
     if not isinstance(content, dict) or "schemas" not in content:
         raise ValueError(f"Malformed manifest: {manifest_path}")
     schemas = content["schemas"] or {}
-    return schemas
-
-
-def find_avsc_files(root: Path) -> Dict[str, Set[Path]]:
-    buckets: Dict[str, Set[Path]] = {}
-    for group_dir in root.iterdir():
-        if group_dir.is_dir():
-            group = group_dir.name
-            group_set: Set[Path] = set()
-            for p in group_dir.rglob("*.avsc"):
-                group_set.add(p.resolve())
-            if group_set:
-                buckets[group] = group_set
+    # Group names are matched against directory names in audit(); interning
+    # both sides lets those dict and set probes compare by identity.
+    return {sys.intern(group): entries for group, entries in schemas.items()}
+
+
+def find_avsc_files(root: Path) -> Dict[str, Set[str]]:
+    # Absolute path strings: DirEntry answers is_dir() from the directory
+    # read, and str hashing is far cheaper than Path hashing in the set ops.
+    buckets: Dict[str, Set[str]] = {}
+    with os.scandir(os.path.abspath(root)) as it:
+        group_dirs = [e for e in it if e.is_dir()]
+    for group_dir in group_dirs:
+        group_set = set(walk_avsc(group_dir.path))
+        if group_set:
+            buckets[sys.intern(group_dir.name)] = group_set
     return buckets
 
 
 def manifest_entries_to_paths(
     manifest_schemas: Dict[str, List[Dict[str, str]]], project_root: Path
-) -> Dict[str, Set[Path]]:
-    out: Dict[str, Set[Path]] = {}
-    for group, entries in manifest_schemas.items():
-        out[group] = set()
-        if not entries:
-            continue
-        for e in entries:
-            fp = e.get("file")
-            if not fp:
-                continue
-            out[group].add((project_root / fp).resolve())
+) -> Dict[str, Set[str]]:
+    root = os.path.abspath(project_root)
+    out: Dict[str, Set[str]] = {group: set() for group in manifest_schemas}
+    for entry in _manifest.group_entries(manifest_schemas):
+        if entry.file:
+            out[entry.domain].add(os.path.abspath(os.path.join(root, entry.file)))
     return out
 
 
 def audit(
     manifest_path: Path, schemas_root: Path
-) -> Tuple[Dict[str, List[str]], Dict[str, List[str]], Dict[str, List[str]]]:
+) -> Tuple[Dict[str, List[str]], Dict[str, List[str]], Dict[str, List[str]], bool]:
+    """
+    Return (keep, remove, missing) path lists per group, plus whether any
+    remove or missing list is non-empty. Groups are in sorted order; the
+    paths within each list are not, callers sort what they print.
+    """
     fs = find_avsc_files(schemas_root)
     mf = manifest_entries_to_paths(
         load_manifest(manifest_path), project_root=manifest_path.parent.parent
@@ -58,19 +65,29 @@ def audit(
     remove: Dict[str, List[str]] = {}
     missing: Dict[str, List[str]] = {}
 
-    all_groups = set(fs.keys()) | set(mf.keys())
+    empty: Set[str] = set()
+    has_issues = False
+    for group in sorted(fs.keys() | mf.keys()):
+        # Both sides hold normalized absolute path strings, so membership
+        # tests are plain str hash probes and need no conversion.
+        fs_paths = fs.get(group, empty)
+        mf_paths = mf.get(group, empty)
 
-    for group in sorted(all_groups):
-        fs_paths = fs.get(group, set())
-        mf_paths = mf.get(group, set())
-
-        keep[group] = sorted(str(p) for p in (fs_paths & mf_paths))
-        # present in manifest but not on disk
-        remove[group] = sorted(str(p) for p in (mf_paths - fs_paths))
+        # One pass over each side puts every path in exactly one bucket.
+        keep_g: List[str] = []
         # present on disk but missing in manifest
-        missing[group] = sorted(str(p) for p in (fs_paths - mf_paths))
+        missing_g: List[str] = []
+        for p in fs_paths:
+            (keep_g if p in mf_paths else missing_g).append(p)
+        # present in manifest but not on disk
+        remove_g = [p for p in mf_paths if p not in fs_paths]
+
+        keep[group] = keep_g
+        remove[group] = remove_g
+        missing[group] = missing_g
+        has_issues = has_issues or bool(remove_g or missing_g)
 
-    return keep, remove, missing
+    return keep, remove, missing, has_issues
 
 
 def main():
@@ -89,15 +106,22 @@ def main():
     manifest_path = Path(args.manifest).resolve()
     schemas_root = Path(args.schemas_root).resolve()
 
-    keep, remove, missing = audit(manifest_path, schemas_root)
+    keep, remove, missing, has_issues = audit(manifest_path, schemas_root)
 
-    summary = {
-        "keep": keep,
-        "remove": remove,
-        "missing": missing,
-    }
+    if not args.json and not has_issues:
+        print("✓ no drift")
+        sys.exit(0)
 
     if args.json:
+        # Set iteration order varies between runs; keep JSON output diffable.
+        summary = {
+            section: {group: sorted(items) for group, items in data.items()}
+            for section, data in (
+                ("keep", keep),
+                ("remove", remove),
+                ("missing", missing),
+            )
+        }
         print(json.dumps(summary, indent=2, sort_keys=True))
     else:
         for section_name, data in [
@@ -110,13 +134,12 @@ def main():
                 if not items:
                     continue
                 print(f"[{group}]")
-                for item in items:
+                for item in sorted(items):
                     print(f" - {item}")
         print("\nTip: run with --json for machine-readable output.")
 
     # return non-zero if any remove or missing to catch drift in CI
-    any_issues = any(v for v in remove.values()) or any(v for v in missing.values())
-    sys.exit(1 if any_issues else 0)
+    sys.exit(1 if has_issues else 0)
 
 
 if __name__ == "__main__":
@@ -17,24 +17,45 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 try:
-    import yaml  # type: ignore
+    import yaml  # type: ignore  # noqa: F401 - dependency check only
 except Exception:
     print(
         "ERROR: pyyaml is required to run this tool. Install dependencies with Poetry."
     )
     raise
 
+try:
+    from ._fastjson import dumps, loads
+    from ._fs import walk_avsc
+    from ._manifest import group_entries, load_manifest
+except ImportError:  # executed as a plain script
+    from _fastjson import dumps, loads
+    from _fs import walk_avsc
+    from _manifest import group_entries, load_manifest
+
+# Probe used by _has_version, compiled once rather than per file.
+_VERSION_RE = re.compile(rb'^  "version"\s*:\s*(?!\s|null\b|"")', re.MULTILINE)
+
 
 def load_manifest_versions(manifest_path: Optional[Path]) -> Dict[str, str]:
     """
     Load per-file versions from a YAML manifest, if available.
-    Returns a mapping of normalized file path -> version string.
+    Returns a mapping of normalized file path -> version string. A manifest
+    that exists but cannot be read or has the wrong shape ends the run with
+    exit status 2, before any file is touched.
+
+    Each entry is stored under its relative POSIX "file" value and under the
+    absolute path it names, resolved both against the working directory and
+    against the repo root holding the manifest, so lookups for walked files
+    are a single dict probe.
     """
     versions: Dict[str, str] = {}
     if not manifest_path:
@@ -43,23 +64,28 @@ def load_manifest_versions(manifest_path: Optional[Path]) -> Dict[str, str]:
         return versions
 
     try:
-        manifest = yaml.safe_load(manifest_path.read_text())
-        schemas = manifest.get("schemas", {})
-        # Manifest structure: schemas: { category: [ { name, file, version, ...}, ...], ... }
-        for category, entries in schemas.items():
-            if not isinstance(entries, list):
-                continue
-            for entry in entries:
-                if not isinstance(entry, dict):
-                    continue
-                fpath = entry.get("file")
-                ver = entry.get("version")
-                if isinstance(fpath, str) and isinstance(ver, (str, int, float)):
-                    # Normalize relative POSIX path representation
-                    norm = Path(fpath).as_posix()
-                    versions[norm] = str(ver)
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(manifest_path)))
+        manifest = load_manifest(manifest_path) or {}
+        if not isinstance(manifest, dict):
+            raise ValueError("manifest is not a mapping")
+        schemas = manifest.get("schemas") or {}
+        if not isinstance(schemas, dict):
+            raise ValueError("'schemas' is not a mapping")
+        # group_entries checks the shape in the same single pass that
+        # collects versions; empty groups are accepted.
+        for _, _, fpath, ver, _ in group_entries(schemas, strict=True):
+            if fpath and ver is not None:
+                # Normalize relative POSIX path representation
+                norm = Path(fpath).as_posix()
+                ver_str = str(ver)
+                versions[norm] = ver_str
+                versions[os.path.abspath(fpath)] = ver_str
+                versions[os.path.abspath(os.path.join(repo_root, fpath))] = ver_str
     except Exception as e:
-        print(f"WARNING: Failed to load manifest '{manifest_path}': {e}")
+        # Falling back to --version for every file would silently overwrite
+        # the versions the manifest pins.
+        print(f"ERROR: Failed to load manifest '{manifest_path}': {e}")
+        sys.exit(2)
     return versions
 
 
@@ -69,57 +95,42 @@ def determine_version_for_file(
     """
     Determine version for a given AVSC file using manifest mapping if present.
     """
-    # Try to match by relative path from repo root (posix)
-    rel_posix = avsc_path.as_posix()
-    # Also try to match by path relative to project root without leading ./ if present
-    rel_from_cwd = (
-        avsc_path.relative_to(Path(".")).as_posix()
-        if avsc_path.is_absolute() is False
-        else avsc_path.as_posix()
-    )
-
-    # Common manifest "file" entries may be prefixed with "schemas/"
-    candidates = {
-        rel_posix,
-        rel_from_cwd,
-        f"schemas/{avsc_path.name}" if "schemas/" not in rel_from_cwd else rel_from_cwd,
-        (
-            f"schemas/{avsc_path.relative_to('schemas').as_posix()}"
-            if rel_from_cwd.startswith("schemas/")
-            else rel_from_cwd
-        ),
-    }
+    return manifest_versions.get(os.path.abspath(avsc_path), default_version)
 
-    for key in candidates:
-        if key in manifest_versions:
-            return manifest_versions[key]
 
-    return default_version
+def _has_version(raw: bytes) -> bool:
+    """
+    Cheap probe for a non-empty top-level "version" key, run before the full
+    JSON parse. It only recognises the key at the two-space indentation these
+    tools write; any other layout just falls through to the parse.
+    """
+    return _VERSION_RE.search(raw) is not None
 
 
-def process_avsc_file(
+def _process(
     avsc_file: Path,
     manifest_versions: Dict[str, str],
     default_version: str,
-    dry_run: bool = False,
-) -> bool:
+    dry_run: bool,
+) -> Tuple[bool, List[str]]:
     """
-    Add a top-level "version" to the AVSC file if missing.
-    Returns True if file was modified.
+    Worker for `process_avsc_file`. Returns (modified, messages) rather than
+    printing, so concurrent callers can report in a stable order.
     """
     try:
-        raw = avsc_file.read_text(encoding="utf-8")
-        data = json.loads(raw)
+        raw = avsc_file.read_bytes()
+        if _has_version(raw):
+            return False, []  # already has a version; skip the parse
+        data = loads(raw)
     except Exception as e:
-        print(f"WARNING: Skipping invalid JSON file: {avsc_file} ({e})")
-        return False
+        return False, [f"WARNING: Skipping invalid JSON file: {avsc_file} ({e})"]
 
     if not isinstance(data, dict):
         # Only handle record/enum/fixed schemas represented as dicts
-        return False
+        return False, []
 
     if "version" in data and data["version"] not in (None, ""):
-        return False  # already has a version
+        return False, []  # already has a version
 
     version_val = determine_version_for_file(
         avsc_file, manifest_versions, default_version
@@ -127,15 +138,29 @@ def process_avsc_file(
     data["version"] = version_val
 
     if dry_run:
-        print(f"DRY-RUN: would set version={version_val} in {avsc_file}")
-        return False
+        return False, [f"DRY-RUN: would set version={version_val} in {avsc_file}"]
 
     # Re-write with indentation to keep readable
-    avsc_file.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    avsc_file.write_bytes(dumps(data))
+    return True, [f"✔ Set version={version_val} in {avsc_file}"]
+
+
+def process_avsc_file(
+    avsc_file: Path,
+    manifest_versions: Dict[str, str],
+    default_version: str,
+    dry_run: bool = False,
+) -> bool:
+    """
+    Add a top-level "version" to the AVSC file if missing.
+    Returns True if file was modified.
+    """
+    modified, messages = _process(
+        avsc_file, manifest_versions, default_version, dry_run
     )
-    print(f"✔ Set version={version_val} in {avsc_file}")
-    return True
+    for msg in messages:
+        print(msg)
+    return modified
 
 
 def main() -> None:
@@ -177,14 +202,22 @@ def main() -> None:
 
     manifest_versions = load_manifest_versions(manifest_path)
 
+    avsc_files = [Path(p) for p in walk_avsc(str(schemas_root))]
+
+    def work(avsc: Path) -> Tuple[bool, List[str]]:
+        return _process(avsc, manifest_versions, default_version, args.dry_run)
+
+    # Files are independent; overlap their reads and writes. Messages are
+    # printed afterwards in walk order.
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        results = list(ex.map(work, avsc_files))
+
+    scanned = len(avsc_files)
     modified = 0
-    scanned = 0
-    for avsc in schemas_root.rglob("*.avsc"):
-        scanned += 1
-        if process_avsc_file(
-            avsc, manifest_versions, default_version, dry_run=args.dry_run
-        ):
-            modified += 1
+    for was_modified, messages in results:
+        for msg in messages:
+            print(msg)
+        modified += was_modified
 
     print(f"\nSummary: scanned {scanned} schema file(s), modified {modified} file(s).")
     sys.exit(0)
@@ -0,0 +1,66 @@
+"""
+validate_all.py
+===============
+
+Single-pass combination of ``validate_schemas`` and ``audit_schema_defaults``.
+
+schemas/manifest.yml is loaded once and every referenced Avro file is read
+and parsed once; both checks then run on the same parsed document:
+
+* the `"version"` field inside each Avro file matches the manifest entry
+* nullable fields declare `"default": null` and non-nullable fields do not
+
+Prefer this over running the two tools back to back (e.g. in CI).
+
+Exit status
+-----------
+0  – all checks pass
+1  – any problem found
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+try:
+    from ._checks import check_defaults, check_version, load_entries, load_entry
+    from ._manifest import ManifestEntry
+except ImportError:  # executed as a plain script
+    from _checks import check_defaults, check_version, load_entries, load_entry
+    from _manifest import ManifestEntry
+
+
+def _validate_entry(entry: ManifestEntry) -> List[str]:
+    problems: List[str] = []
+    schema_json = load_entry(entry, problems)
+    if schema_json is not None:
+        check_version(entry, schema_json, problems)
+        check_defaults(schema_json, problems)
+    return problems
+
+
+def validate_all() -> List[str]:
+    problems: List[str] = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for entry_problems in ex.map(_validate_entry, load_entries()):
+            problems.extend(entry_problems)
+    return problems
+
+
+def main() -> None:
+    issues = validate_all()
+    if issues:
+        print("❌ Schema validation failed:")
+        for issue in issues:
+            print(" •", issue)
+        sys.exit(1)
+
+    print("✓ Schema versions and defaults are consistent.")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
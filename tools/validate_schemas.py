@@ -19,65 +19,22 @@ Exit status
 
 from __future__ import annotations
 
-import json
 import sys
-from pathlib import Path
-from typing import Dict, List
+from typing import List
 
-import yaml
-
-# We are now under schemas/tools/, so the repo root is two levels up.
-REPO_ROOT = Path(__file__).resolve().parents[2]
-MANIFEST_PATH = REPO_ROOT / "schemas" / "manifest.yml"
-
-
-class SchemaValidationError(RuntimeError):
-    """Raised when the validator detects any mismatch."""
-
-
-def _load_manifest() -> Dict:
-    if not MANIFEST_PATH.exists():
-        raise SchemaValidationError("schemas/manifest.yml not found")
-    try:
-        return yaml.safe_load(MANIFEST_PATH.read_text())
-    except yaml.YAMLError as exc:  # pragma: no cover
-        raise SchemaValidationError(f"manifest.yml is not valid YAML: {exc}") from exc
-
-
-def _iter_manifest_entries(manifest: Dict):
-    for domain, entries in manifest.get("schemas", {}).items():
-        for entry in entries:
-            yield domain, entry
-
-
-def _validate_file(domain: str, entry: Dict, errors: List[str]) -> None:
-    avsc_path = REPO_ROOT / entry["file"]
-    if not avsc_path.exists():
-        errors.append(f"{domain}.{entry['name']}: file missing at {avsc_path}")
-        return
-
-    try:
-        schema_json = json.loads(avsc_path.read_text())
-    except json.JSONDecodeError as exc:
-        errors.append(f"{avsc_path}: invalid JSON ({exc})")
-        return
-
-    # Allow files that contain a list of definitions
-    top = schema_json[0] if isinstance(schema_json, list) else schema_json
-    embedded_version = top.get("version")
-    declared_version = entry.get("version")
-    if embedded_version != declared_version:
-        errors.append(
-            f"{domain}.{entry['name']}: version mismatch "
-            f"(manifest={declared_version}, file={embedded_version})"
-        )
+# SchemaValidationError is re-exported for callers of this module.
+try:
+    from ._checks import SchemaValidationError, check_version, load_entries, load_entry
+except ImportError:  # executed as a plain script
+    from _checks import SchemaValidationError, check_version, load_entries, load_entry
 
 
 def validate() -> List[str]:
-    manifest = _load_manifest()
     problems: List[str] = []
-    for domain, entry in _iter_manifest_entries(manifest):
-        _validate_file(domain, entry, problems)
+    for entry in load_entries():
+        schema_json = load_entry(entry, problems)
+        if schema_json is not None:
+            check_version(entry, schema_json, problems)
     return problems
 
 
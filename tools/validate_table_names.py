@@ -3,8 +3,10 @@
 validate_table_names.py
 =======================
 
-Validates that all schemas in manifest.yml have explicit table_name field.
-This ensures the manifest is the single source of truth for table naming.
+Validates that all schemas in manifest.yml have explicit table_name field,
+and that every *.avsc file under schemas/ has a manifest entry to take its
+table_name from. This ensures the manifest is the single source of truth for
+table naming.
 
 Exit status:
 0  – all checks pass
@@ -17,15 +19,25 @@ Usage:
 
 from __future__ import annotations
 
+import os
 import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set
 
 import yaml
 
+try:
+    from ._fs import walk_avsc
+    from ._manifest import group_entries, load_manifest
+except ImportError:  # executed as a plain script
+    from _fs import walk_avsc
+    from _manifest import group_entries, load_manifest
+
 # Repo root is two levels up from this file
 REPO_ROOT = Path(__file__).resolve().parents[2]
-MANIFEST_PATH = REPO_ROOT / "schemas" / "manifest.yml"
+SCHEMAS_ROOT = REPO_ROOT / "schemas"
+MANIFEST_PATH = SCHEMAS_ROOT / "manifest.yml"
 
 
 def validate_table_names() -> List[str]:
@@ -41,45 +53,39 @@ def validate_table_names() -> List[str]:
         return [f"manifest.yml not found at {MANIFEST_PATH}"]
 
     try:
-        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
-            manifest = yaml.safe_load(f) or {}
+        manifest = load_manifest(MANIFEST_PATH) or {}
     except yaml.YAMLError as exc:
         return [f"manifest.yml is not valid YAML: {exc}"]
 
     errors: List[str] = []
     total_schemas = 0
     schemas_with_table_name = 0
-    duplicate_table_names: Dict[str, List[str]] = {}
+    duplicate_table_names: Dict[str, List[str]] = defaultdict(list)
+    # Absolute paths of every file the manifest lists, for the disk check
+    manifest_files: Set[str] = set()
 
     # Check each schema in manifest
-    for category, entries in manifest.get("schemas", {}).items():
-        if not isinstance(entries, list):
-            continue
-
-        for entry in entries:
-            if not isinstance(entry, dict):
-                continue
+    schemas = manifest.get("schemas", {})
+    for category, name, file_path, _, table_name in group_entries(schemas):
+        if isinstance(file_path, str):
+            manifest_files.add(os.path.abspath(REPO_ROOT / file_path))
 
-            total_schemas += 1
-            name = entry.get("name", "")
-            table_name = entry.get("table_name")
+        total_schemas += 1
 
-            if not name:
-                errors.append(f"{category}: schema entry missing 'name' field")
-                continue
+        if not name:
+            errors.append(f"{category}: schema entry missing 'name' field")
+            continue
 
-            if not table_name:
-                errors.append(
-                    f"{category}.{name}: missing 'table_name' field. "
-                    "All schemas must have explicit table_name for consistency."
-                )
-            else:
-                schemas_with_table_name += 1
+        if not table_name:
+            errors.append(
+                f"{category}.{name}: missing 'table_name' field. "
+                "All schemas must have explicit table_name for consistency."
+            )
+        else:
+            schemas_with_table_name += 1
 
-                # Check for duplicate table names
-                if table_name not in duplicate_table_names:
-                    duplicate_table_names[table_name] = []
-                duplicate_table_names[table_name].append(f"{category}.{name}")
+            # Check for duplicate table names
+            duplicate_table_names[table_name].append(f"{category}.{name}")
 
     # Check for duplicates
     for table_name, schema_list in duplicate_table_names.items():
@@ -88,11 +94,22 @@ def validate_table_names() -> List[str]:
                 f"Duplicate table_name '{table_name}' used by: {', '.join(schema_list)}"
             )
 
+    # Check that every schema file on disk is covered by a manifest entry
+    unlisted_files = 0
+    for avsc_path in walk_avsc(str(SCHEMAS_ROOT)):
+        if avsc_path not in manifest_files:
+            unlisted_files += 1
+            errors.append(
+                f"{os.path.relpath(avsc_path, REPO_ROOT)}: no manifest entry, "
+                "so no table_name is defined for it."
+            )
+
     # Summary
     print("\nTable Name Validation Report:")
     print(f"  Total schemas: {total_schemas}")
     print(f"  Schemas with table_name: {schemas_with_table_name}")
     print(f"  Schemas missing table_name: {total_schemas - schemas_with_table_name}")
+    print(f"  Schema files not in manifest: {unlisted_files}")
 
     return errors
 